@@ -1,10 +1,8 @@
 from flask import Flask, request, render_template, flash, redirect, url_for
-from werkzeug.utils import secure_filename
-import os
 from .gff3_validator import GFF3Validator
 
 app = Flask(__name__)
-app.config['UPLOAD_FOLDER'] = 'uploads/'
+app.config['MAX_CONTENT_LENGTH'] = 1024 * 1024 * 1024  # 1 GiB
 app.secret_key = 'your_secret_key'
 
 @app.route('/', methods=['GET', 'POST'])
@@ -20,12 +18,8 @@ def index():
             return redirect(url_for('index'))
 
         if file:
-            filename = secure_filename(file.filename)
-            file_path = os.path.join(app.config['UPLOAD_FOLDER'], filename)
-            file.save(file_path)
-
             validator = GFF3Validator()
-            errors = validator.validate_file(file_path)
+            errors = validator.validate_stream(file.stream)
 
             if errors:
                 flash('GFF3 file contains errors. See details below.', 'danger')
@@ -37,4 +31,4 @@ def index():
     return render_template('index.html')
 
 if __name__ == '__main__':
-    app.run(debug=True)
+    app.run()
@@ -1,10 +1,26 @@
+import multiprocessing
 import os
-import re
+from array import array
 from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
 from linkml_runtime.linkml_model.meta import SchemaDefinition, ClassDefinition, SlotDefinition, ClassDefinitionName, SlotDefinitionName
 from linkml_runtime.utils.schemaview import SchemaView
 from linkml_runtime.utils.yamlutils import YAMLRoot
 
+READ_BUFFER_SIZE = 1 << 20
+READ_CHUNK_SIZE = 4 << 20
+
+_VALID_STRANDS = frozenset(('+', '-', '.'))
+
+# Attributes whose values must name an ID in the same file, by error key
+REFERENCE_ATTRIBUTES = {
+    'parent': 'Parent',
+    'target': 'Target',
+    'derives_from': 'Derives_from',
+}
+
+
 class GFF3Validator:
     """
     Validates GFF3 files against the GFF3 specification.
@@ -21,14 +37,48 @@ class GFF3Validator:
         self.schema_view = SchemaView(schema_path)
         self.class_definitions = {name: self.schema_view.get_class(name) for name in self.schema_view.all_class_names()}
         self.slot_definitions = {name: self.schema_view.get_slot(name) for name in self.schema_view.all_slot_names()}
-        self.seen_ids = set()
-        self.parent_relationships = defaultdict(list)
-        self.feature_types = set()
+        # Resolve the schema checks once rather than on every line
+        self._class_check = {name: self.class_definitions[name].typeof
+                             for name in ('Seqid', 'Source', 'Type') if self.schema_view.has_class(name)}
+        self._slot_check = {name: slot.typeof for name, slot in self.slot_definitions.items()}
+        self._permissible_types = frozenset(
+            getattr(self.class_definitions.get('Type'), 'permissible_values', None) or ())
+        # Enumerated classes only need a membership test against their values
+        for name in self._class_check:
+            if name == 'Type':
+                values = self._permissible_types
+            else:
+                values = frozenset(getattr(self.class_definitions[name], 'permissible_values', None) or ())
+            if values:
+                self._class_check[name] = values.__contains__
+        self._reset()
+        # Deletion tables: a non-empty translate() result means a disallowed character.
+        # ID and Alias share the same allowed character set.
+        self._id_delete = str.maketrans('', '', 'abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ0123456789.:^*$@!+_?-')
+        self._nt_keep = str.maketrans('', '', 'ACGTacgt')
+        self._aa_keep = str.maketrans('', '', 'ACDEFGHIKLMNPQRSTVWYacdefghiklmnpqrstvwy*')
+        # Reserved attribute checks, keyed by attribute name
+        self._attr_handlers = {
+            'Parent': self._check_parent,
+            'Alias': self._check_alias,
+            'Note': self._check_note,
+            'Target': self._check_target,
+            'Derives_from': self._check_derives,
+            'Gap': self._check_gap,
+            'Replacement': self._check_replacement,
+            'Sequence': partial(self._check_nt, 'Sequence'),
+            'Variant_seq': partial(self._check_nt, 'Variant_seq'),
+            'Amino_acid': self._check_aa,
+            'Codon': self._check_codon,
+        }
     
     def validate_line(self, line_number, line):
         """
         Validate a single line of a GFF3 file.
         
+        Parent, Target and Derives_from references are only recorded here;
+        they are resolved against all IDs in the file by validate_file.
+        
         Args:
             line_number (int): The line number of the GFF3 file.
             line (str): A single line of a GFF3 file.
@@ -36,24 +86,28 @@ class GFF3Validator:
         Returns:
             dict: A dictionary containing validation errors, if any.
         """
-        fields = line.strip().split('\t')
+        # Only drop the line ending: leading whitespace would hide a missing column
+        fields = line.rstrip('\r\n').split('\t')
         if len(fields) != 9:
             return {'error': 'Line must have 9 tab-separated fields'}
         
         seqid, source, type, start, end, score, strand, phase, attributes = fields
         
-        errors = {}
+        errors = defaultdict(list)
         
         # Validate seqid
-        if not self.schema_view.has_class('Seqid') or not self.class_definitions['Seqid'].typeof(seqid):
+        check = self._class_check.get('Seqid')
+        if check is None or not check(seqid):
             errors['seqid'] = f'Invalid seqid: {seqid}'
         
         # Validate source
-        if not self.schema_view.has_class('Source') or not self.class_definitions['Source'].typeof(source):
+        check = self._class_check.get('Source')
+        if check is None or not check(source):
             errors['source'] = f'Invalid source: {source}'
         
         # Validate type
-        if not self.schema_view.has_class('Type') or not self.class_definitions['Type'].typeof(type):
+        check = self._class_check.get('Type')
+        if check is None or not check(type):
             errors['type'] = f'Invalid type: {type}'
         else:
             self.feature_types.add(type)
@@ -71,145 +125,140 @@ class GFF3Validator:
             errors['end'] = f'Invalid end position: {end}'
         
         # Validate score
-        if score != '.' and (not self.schema_view.has_slot('score') or not self.slot_definitions['score'].typeof(score)):
+        check = self._slot_check.get('score')
+        if score != '.' and (check is None or not check(score)):
             errors['score'] = f'Invalid score: {score}'
         
         # Validate strand
-        if strand not in ['+', '-', '.']:
+        if strand not in _VALID_STRANDS:
             errors['strand'] = f'Invalid strand: {strand}'
         
         # Validate phase
-        if phase != '.' and (not self.schema_view.has_slot('phase') or not self.slot_definitions['phase'].typeof(phase)):
+        check = self._slot_check.get('phase')
+        if phase != '.' and (check is None or not check(phase)):
             errors['phase'] = f'Invalid phase: {phase}'
         
         # Validate attributes
         attr_dict = {}
+        slot_check = self._slot_check
         for attr in attributes.split(';'):
-            if '=' in attr:
-                key, value = attr.split('=', 1)
-                attr_dict[key] = value
-            else:
-                attr_dict[attr] = True
-        
-        for key, value in attr_dict.items():
-            if not self.schema_view.has_slot(key) or not self.slot_definitions[key].typeof(value):
+            key, sep, value = attr.partition('=')
+            if not sep:
+                value = True
+            attr_dict[key] = value
+            check = slot_check.get(key)
+            if check is None or not check(value):
                 errors[f'attribute.{key}'] = f'Invalid attribute: {key}={value}'
         
         # Additional validation checks from the Perl validator
         
-        # Check for duplicate IDs
-        if 'ID' in attr_dict:
-            id_value = attr_dict['ID']
+        # Check for duplicate IDs and invalid characters in IDs
+        id_value = attr_dict.get('ID')
+        if id_value is not None:
+            # IDs recur as Parent/Target/Derives_from values on other lines;
+            # keep a single copy of each in seen_ids and the reference lists
+            id_value = self._canonical(id_value)
             if id_value in self.seen_ids:
-                errors['id'] = f'Duplicate ID: {id_value}'
+                errors['id'].append(f'Duplicate ID: {id_value}')
             else:
-                self.seen_ids.add(id_value)
-        
-        # Check for invalid characters in IDs
-        if 'ID' in attr_dict:
-            id_value = attr_dict['ID']
-            if not re.match(r'^[a-zA-Z0-9.:^*$@!+_?-]+$', id_value):
-                errors['id'] = f'Invalid characters in ID: {id_value}'
-        
-        # Check for invalid Parent relationships
-        if 'Parent' in attr_dict:
-            parent_ids = attr_dict['Parent'].split(',')
-            for parent_id in parent_ids:
-                if parent_id not in self.seen_ids:
-                    errors.setdefault('parent', []).append(f'Parent ID not found: {parent_id}')
-                self.parent_relationships[parent_id].append(id_value)
+                self.seen_ids[id_value] = line_number
+            if not id_value or id_value.translate(self._id_delete):
+                errors['id'].append(f'Invalid characters in ID: {id_value}')
         
-        # Check for circular references in Parent relationships
-        if 'Parent' in attr_dict:
-            parent_ids = attr_dict['Parent'].split(',')
-            for parent_id in parent_ids:
-                if parent_id in self.parent_relationships and id_value in self.parent_relationships[parent_id]:
-                    errors.setdefault('parent', []).append(f'Circular reference detected for ID: {id_value}')
-        
-        # Check for invalid Alias values
-        if 'Alias' in attr_dict:
-            alias_values = attr_dict['Alias'].split(',')
-            for alias_value in alias_values:
-                if not re.match(r'^[a-zA-Z0-9.:^*$@!+_?-]+$', alias_value):
-                    errors.setdefault('alias', []).append(f'Invalid characters in Alias: {alias_value}')
-        
-        # Check for invalid Note values
-        if 'Note' in attr_dict:
-            note_values = attr_dict['Note'].split(',')
-            for note_value in note_values:
-                if not note_value:
-                    errors.setdefault('note', []).append('Empty Note value')
-        
-        # Check for invalid Target values
-        if 'Target' in attr_dict:
-            target_values = attr_dict['Target'].split()
-            if len(target_values) < 3:
-                errors.setdefault('target', []).append(f'Invalid Target attribute: {attr_dict["Target"]}')
-            else:
-                target_id, target_start, target_end = target_values[:3]
-                if target_id not in self.seen_ids:
-                    errors.setdefault('target', []).append(f'Target ID not found: {target_id}')
-                try:
-                    target_start_int = int(target_start)
-                    target_end_int = int(target_end)
-                    if target_start_int < 1:
-                        errors.setdefault('target', []).append(f'Target start position must be >= 1: {target_start}')
-                    if target_end_int < target_start_int:
-                        errors.setdefault('target', []).append(f'Target end position must be >= start position: {target_end}')
-                except ValueError:
-                    errors.setdefault('target', []).append('Invalid Target start or end position')
-        
-        # Check for invalid Derives_from values
-        if 'Derives_from' in attr_dict:
-            derives_from_values = attr_dict['Derives_from'].split(',')
-            for derives_from_value in derives_from_values:
-                if derives_from_value not in self.seen_ids:
-                    errors.setdefault('derives_from', []).append(f'Derives_from ID not found: {derives_from_value}')
-        
-        # Check for invalid Gap values
-        if 'Gap' in attr_dict:
-            gap_values = attr_dict['Gap'].split()
-            if len(gap_values) < 2:
-                errors.setdefault('gap', []).append(f'Invalid Gap attribute: {attr_dict["Gap"]}')
-            else:
-                try:
-                    gap_length = int(gap_values[0])
-                    if gap_length < 0:
-                        errors.setdefault('gap', []).append(f'Invalid Gap length: {gap_values[0]}')
-                except ValueError:
-                    errors.setdefault('gap', []).append(f'Invalid Gap length: {gap_values[0]}')
-        
-        # Check for invalid Replacement values
-        if 'Replacement' in attr_dict:
-            replacement_value = attr_dict['Replacement']
-            if len(replacement_value) != 1:
-                errors.setdefault('replacement', []).append(f'Invalid Replacement value: {replacement_value}')
-        
-        # Check for invalid Sequence attribute
-        if 'Sequence' in attr_dict:
-            sequence_value = attr_dict['Sequence']
-            if not all(c in 'ACGTacgt' for c in sequence_value):
-                errors.setdefault('sequence', []).append(f'Invalid characters in Sequence: {sequence_value}')
-        
-        # Check for invalid Variant_seq attribute
-        if 'Variant_seq' in attr_dict:
-            variant_seq_value = attr_dict['Variant_seq']
-            if not all(c in 'ACGTacgt' for c in variant_seq_value):
-                errors.setdefault('variant_seq', []).append(f'Invalid characters in Variant_seq: {variant_seq_value}')
-        
-        # Check for invalid Amino_acid attribute
-        if 'Amino_acid' in attr_dict:
-            amino_acid_value = attr_dict['Amino_acid']
-            if not all(c in 'ACDEFGHIKLMNPQRSTVWYacdefghiklmnpqrstvwy*' for c in amino_acid_value):
-                errors.setdefault('amino_acid', []).append(f'Invalid characters in Amino_acid: {amino_acid_value}')
-        
-        # Check for invalid Codon attribute
-        if 'Codon' in attr_dict:
-            codon_value = attr_dict['Codon']
-            if len(codon_value) != 3 or not all(c in 'ACGTacgt' for c in codon_value):
-                errors.setdefault('codon', []).append(f'Invalid Codon value: {codon_value}')
+        # Dispatch the remaining reserved attributes to their checks
+        for key, value in attr_dict.items():
+            handler = self._attr_handlers.get(key)
+            if handler is not None:
+                handler(line_number, value, errors, id_value)
         
-        return errors
+        return dict(errors)
+    
+    def _check_parent(self, line_number, value, errors, id_value):
+        """
+        Record Parent references and edges.
+        
+        Nothing is looked up here: unresolved parents and circular references
+        are found by validate_file once the whole file has been read.
+        """
+        ref_lines = self._ref_lines['parent']
+        ref_ids = self._ref_ids['parent']
+        child = None if id_value is None else self._intern(id_value)
+        for parent_id in value.split(','):
+            parent = self._intern(parent_id)
+            ref_lines.append(line_number)
+            ref_ids.append(self._int_to_id[parent])
+            if child is not None:
+                self._parent_edges.append((parent, child))
+    
+    def _check_alias(self, line_number, value, errors, id_value):
+        """Check for invalid Alias values."""
+        for alias_value in value.split(','):
+            if not alias_value or alias_value.translate(self._id_delete):
+                errors['alias'].append(f'Invalid characters in Alias: {alias_value}')
+    
+    def _check_note(self, line_number, value, errors, id_value):
+        """Check for invalid Note values."""
+        for note_value in value.split(','):
+            if not note_value:
+                errors['note'].append('Empty Note value')
+    
+    def _check_target(self, line_number, value, errors, id_value):
+        """Check for invalid Target values."""
+        target_values = value.split()
+        if len(target_values) < 3:
+            errors['target'].append(f'Invalid Target attribute: {value}')
+            return
+        target_id, target_start, target_end = target_values[:3]
+        self._ref_lines['target'].append(line_number)
+        self._ref_ids['target'].append(self._canonical(target_id))
+        try:
+            target_start_int = int(target_start)
+            target_end_int = int(target_end)
+            if target_start_int < 1:
+                errors['target'].append(f'Target start position must be >= 1: {target_start}')
+            if target_end_int < target_start_int:
+                errors['target'].append(f'Target end position must be >= start position: {target_end}')
+        except ValueError:
+            errors['target'].append('Invalid Target start or end position')
+    
+    def _check_derives(self, line_number, value, errors, id_value):
+        """Check for invalid Derives_from values."""
+        for derives_from_value in value.split(','):
+            self._ref_lines['derives_from'].append(line_number)
+            self._ref_ids['derives_from'].append(self._canonical(derives_from_value))
+    
+    def _check_gap(self, line_number, value, errors, id_value):
+        """Check for invalid Gap values."""
+        gap_values = value.split()
+        if len(gap_values) < 2:
+            errors['gap'].append(f'Invalid Gap attribute: {value}')
+            return
+        try:
+            gap_length = int(gap_values[0])
+            if gap_length < 0:
+                errors['gap'].append(f'Invalid Gap length: {gap_values[0]}')
+        except ValueError:
+            errors['gap'].append(f'Invalid Gap length: {gap_values[0]}')
+    
+    def _check_replacement(self, line_number, value, errors, id_value):
+        """Check for invalid Replacement values."""
+        if len(value) != 1:
+            errors['replacement'].append(f'Invalid Replacement value: {value}')
+    
+    def _check_nt(self, key, line_number, value, errors, id_value):
+        """Check a Sequence or Variant_seq attribute for non-nucleotide characters."""
+        if value.translate(self._nt_keep):
+            errors[key.lower()].append(f'Invalid characters in {key}: {value}')
+    
+    def _check_aa(self, line_number, value, errors, id_value):
+        """Check for invalid Amino_acid attribute."""
+        if value.translate(self._aa_keep):
+            errors['amino_acid'].append(f'Invalid characters in Amino_acid: {value}')
+    
+    def _check_codon(self, line_number, value, errors, id_value):
+        """Check for invalid Codon attribute."""
+        if len(value) != 3 or value.translate(self._nt_keep):
+            errors['codon'].append(f'Invalid Codon value: {value}')
     
     def validate_file(self, file_path):
         """
@@ -221,30 +270,355 @@ class GFF3Validator:
         Returns:
             dict: A dictionary containing validation errors, if any.
         """
+        with open(file_path, 'rb', buffering=READ_BUFFER_SIZE) as f:
+            return self.validate_stream(f)
+    
+    def validate_stream(self, fh):
+        """
+        Validate GFF3 data read from a binary file-like object.
+        
+        Args:
+            fh: A file-like object opened in binary mode, such as an uploaded file stream.
+        
+        Returns:
+            dict: A dictionary containing validation errors, if any.
+        """
+        self._reset()
+        errors, _, _ = self._validate_lines(self._iter_lines(fh))
+        return self._validate_graph(errors)
+    
+    def validate_file_parallel(self, file_path, workers=None):
+        """
+        Validate a GFF3 file, spreading the per-line checks over a process pool.
+        
+        The file is cut into one byte range per worker, aligned to line
+        boundaries. Each worker validates its lines independently; the ID
+        sets and Parent edges are then merged and the file-level checks
+        (unresolved references, cycles, missing feature types) run once.
+        
+        Workers are started with the ``fork`` method and inherit this validator,
+        so its schema tables (and any subclass overrides) are not rebuilt per
+        worker. Fork is also needed because this module's file name is not
+        importable, so a spawned worker could not load ``_validate_range``.
+        The method is therefore only available on platforms that support fork.
+        
+        Args:
+            file_path (str): The path to the GFF3 file.
+            workers (int): The number of worker processes. Defaults to os.cpu_count().
+        
+        Returns:
+            dict: A dictionary containing validation errors, if any.
+        """
+        if workers is None:
+            workers = os.cpu_count() or 1
+        self._reset()
+        
+        ranges = self._split_ranges(file_path, workers)
+        with ProcessPoolExecutor(max_workers=len(ranges) or 1,
+                                 mp_context=multiprocessing.get_context('fork'),
+                                 initializer=_init_worker, initargs=(self,)) as executor:
+            parts = list(executor.map(_validate_range, [file_path] * len(ranges), *zip(*ranges)))
+        
+        # Ranges past a ##FASTA directive hold sequence data only
+        for i, part in enumerate(parts):
+            if part[1]:
+                del parts[i + 1:]
+                break
+        
         errors = {}
-        self.seen_ids = set()
-        self.parent_relationships = defaultdict(list)
+        offset = 0
+        for line_count, _, part_errors, seen_ids, parent_edges, feature_types, ref_lines, ref_ids in parts:
+            for line_number, line_errors in part_errors.items():
+                errors[line_number + offset] = line_errors
+            self._parent_edges.extend((self._intern(parent_id), self._intern(child_id))
+                                      for parent_id, child_id in parent_edges)
+            for key in REFERENCE_ATTRIBUTES:
+                self._ref_lines[key].extend(line_number + offset for line_number in ref_lines[key])
+                self._ref_ids[key].extend(map(self._canonical, ref_ids[key]))
+            # Duplicate IDs within a range were caught by the worker; an ID
+            # already defined in an earlier range is reported at its line here,
+            # ahead of any other ID error, as validate_line would have done
+            for id_value in seen_ids.keys() & self.seen_ids.keys():
+                line_errors = errors.setdefault(seen_ids.pop(id_value) + offset, {})
+                line_errors.setdefault('id', []).insert(0, f'Duplicate ID: {id_value}')
+            self.seen_ids.update((self._canonical(id_value), line_number + offset)
+                                 for id_value, line_number in seen_ids.items())
+            self.feature_types |= feature_types
+            offset += line_count
+        
+        return self._validate_graph(errors)
+    
+    def _reset(self):
+        """Clear the state collected from a previous file."""
+        # Each ID seen so far, mapped to the line that first defined it
+        self.seen_ids = {}
+        # Parent -> child edges over IDs mapped to ints by _intern
+        self._id_to_int = {}
+        self._int_to_id = []
+        self._parent_edges = []
         self.feature_types = set()
-        line_number = 1
+        # ID references by error key, as parallel lists of line numbers and IDs;
+        # resolved once all IDs in the file have been seen
+        self._ref_lines = {key: [] for key in REFERENCE_ATTRIBUTES}
+        self._ref_ids = {key: [] for key in REFERENCE_ATTRIBUTES}
+    
+    def _validate_lines(self, raw_lines):
+        """
+        Validate each feature line in an iterable of raw lines.
         
-        with open(file_path, 'r') as f:
-            for line in f:
-                if line.startswith('#'):
-                    continue
-                line_errors = self.validate_line(line_number, line)
-                if line_errors:
-                    errors.setdefault(line_number, {}).update(line_errors)
-                line_number += 1
-        
-        # Check for unresolved Parent references
-        for parent_id, child_ids in self.parent_relationships.items():
-            if parent_id not in self.seen_ids:
-                for child_id in child_ids:
-                    errors.setdefault(child_id, {}).setdefault('parent', []).append(f'Parent ID not found: {parent_id}')
-        
-        # Check for duplicate feature types
-        if len(self.feature_types) != len(self.class_definitions['Type'].permissible_values):
-            missing_types = set(self.class_definitions['Type'].permissible_values) - self.feature_types
-            errors['feature_type'] = f'Missing feature types: {", ".join(missing_types)}'
+        Args:
+            raw_lines: An iterable of bytes, one GFF3 line each.
+        
+        Returns:
+            tuple: The per-line error dictionary, the number of lines read and
+            whether a ##FASTA directive ended the feature section.
+        """
+        errors = {}
+        line_number = 0
+        for raw in raw_lines:
+            line_number += 1
+            if not raw or raw == b'\r' or raw[:1] == b'#':
+                # Everything after ##FASTA is sequence data, not features
+                if raw.startswith(b'##FASTA'):
+                    return errors, line_number, True
+                continue
+            line = raw.decode('ascii', 'replace')
+            line_errors = self.validate_line(line_number, line)
+            if line_errors:
+                errors[line_number] = line_errors
+        return errors, line_number, False
+    
+    def _validate_graph(self, errors):
+        """
+        Run the file-level checks once every line has been read.
+        
+        Args:
+            errors (dict): The per-line error dictionary to update.
+        
+        Returns:
+            dict: The updated error dictionary.
+        """
+        # Check for unresolved Parent, Target and Derives_from references
+        for key, attribute in REFERENCE_ATTRIBUTES.items():
+            ref_ids = self._ref_ids[key]
+            unresolved = set(ref_ids).difference(self.seen_ids)
+            if not unresolved:
+                continue
+            # Only walk the references when at least one of them is dangling
+            for ref_line, ref_id in zip(self._ref_lines[key], ref_ids):
+                if ref_id in unresolved:
+                    errors.setdefault(ref_line, {}).setdefault(key, []).append(f'{attribute} ID not found: {ref_id}')
+        
+        # Check for circular references in Parent relationships
+        self._check_cycles(errors)
+        
+        # Check for missing feature types
+        missing_types = self._permissible_types - self.feature_types
+        if missing_types:
+            errors['feature_type'] = f'Missing feature types: {", ".join(sorted(missing_types))}'
         
         return errors
+    
+    @staticmethod
+    def _split_ranges(file_path, workers):
+        """
+        Cut a file into up to ``workers`` byte ranges that start and end on line boundaries.
+        
+        Args:
+            file_path (str): The path to the file.
+            workers (int): The number of ranges wanted.
+        
+        Returns:
+            list: (start, end) byte offsets, one per non-empty range.
+        """
+        size = os.path.getsize(file_path)
+        bounds = [0]
+        with open(file_path, 'rb') as f:
+            for i in range(1, workers):
+                f.seek(max(size * i // workers, bounds[-1]))
+                f.readline()
+                bounds.append(min(f.tell(), size))
+        bounds.append(size)
+        return [(start, end) for start, end in zip(bounds, bounds[1:]) if end > start]
+    
+    @staticmethod
+    def _iter_lines(f, size=None):
+        """
+        Yield the lines of a binary file object, without their trailing newline.
+        
+        The file is read in large chunks and split on b'\n' in bulk; a partial
+        line at the end of a chunk is carried over into the next one.
+        
+        Args:
+            f: A file object opened in binary mode.
+            size (int): Stop after this many bytes. Defaults to reading to the end.
+        
+        Yields:
+            bytes: One raw line of the file.
+        """
+        pending = b''
+        while size is None or size > 0:
+            chunk = f.read(READ_CHUNK_SIZE if size is None else min(READ_CHUNK_SIZE, size))
+            if size is not None:
+                size -= len(chunk)
+            if not chunk:
+                break
+            lines = (pending + chunk).split(b'\n')
+            pending = lines.pop()
+            yield from lines
+        if pending:
+            yield pending
+    
+    def _intern(self, id_value):
+        """
+        Map an ID to a small integer, assigning the next free one on first sight.
+        
+        Args:
+            id_value (str): A feature ID.
+        
+        Returns:
+            int: The ID's index into ``self._int_to_id``.
+        """
+        index = self._id_to_int.get(id_value)
+        if index is None:
+            index = len(self._int_to_id)
+            self._id_to_int[id_value] = index
+            self._int_to_id.append(id_value)
+        return index
+    
+    def _canonical(self, id_value):
+        """
+        Return the validator's stored copy of an ID, so repeats share one string.
+        
+        The copy lives in ``self._int_to_id`` and is released by _reset, unlike
+        sys.intern, which makes strings immortal on Python 3.12.
+        
+        Args:
+            id_value (str): A feature ID.
+        
+        Returns:
+            str: The first copy of this ID seen since the last reset.
+        """
+        return self._int_to_id[self._intern(id_value)]
+    
+    def _check_cycles(self, errors):
+        """
+        Detect circular Parent relationships of any length.
+        
+        Packs the (parent, child) pairs in ``self._parent_edges`` into
+        compressed-row adjacency arrays, then finds the strongly connected
+        components with an iterative Tarjan search. Every ID in a component
+        of more than one node, or with a Parent link to itself, lies on a
+        cycle and is reported.
+        
+        Args:
+            errors (dict): The file-level error dictionary to update.
+        """
+        n = len(self._int_to_id)
+        in_cycle = set()
+        
+        # children[offsets[i]:offsets[i + 1]] are the children of node i
+        offsets = array('i', [0]) * (n + 1)
+        for parent, child in self._parent_edges:
+            offsets[parent + 1] += 1
+            if parent == child:
+                in_cycle.add(parent)
+        for i in range(n):
+            offsets[i + 1] += offsets[i]
+        children = array('i', [0]) * len(self._parent_edges)
+        fill = offsets[:n]
+        for parent, child in self._parent_edges:
+            children[fill[parent]] = child
+            fill[parent] += 1
+        
+        index = array('i', [-1]) * n
+        low = array('i', [0]) * n
+        on_stack = bytearray(n)
+        stack = []
+        counter = 0
+        for root in range(n):
+            if index[root] != -1:
+                continue
+            index[root] = low[root] = counter
+            counter += 1
+            stack.append(root)
+            on_stack[root] = 1
+            path = [root]
+            cursor = [offsets[root]]
+            while path:
+                node = path[-1]
+                i = cursor[-1]
+                if i < offsets[node + 1]:
+                    cursor[-1] = i + 1
+                    child = children[i]
+                    if index[child] == -1:
+                        index[child] = low[child] = counter
+                        counter += 1
+                        stack.append(child)
+                        on_stack[child] = 1
+                        path.append(child)
+                        cursor.append(offsets[child])
+                    elif on_stack[child] and index[child] < low[node]:
+                        low[node] = index[child]
+                    continue
+                
+                path.pop()
+                cursor.pop()
+                if path and low[node] < low[path[-1]]:
+                    low[path[-1]] = low[node]
+                if low[node] == index[node]:
+                    # node is the root of a component: pop it off the stack
+                    component = []
+                    while True:
+                        member = stack.pop()
+                        on_stack[member] = 0
+                        component.append(member)
+                        if member == node:
+                            break
+                    if len(component) > 1:
+                        in_cycle.update(component)
+        
+        for node in sorted(self._int_to_id[i] for i in in_cycle):
+            errors.setdefault(node, {}).setdefault('parent', []).append(f'Circular reference detected for ID: {node}')
+
+
+
+# The validator a pool worker inherits from validate_file_parallel
+_worker_validator = None
+
+
+def _init_worker(validator):
+    """
+    Store the caller's validator in a freshly forked pool worker.
+    
+    Args:
+        validator (GFF3Validator): The validator to run the worker's ranges with.
+    """
+    global _worker_validator
+    _worker_validator = validator
+
+
+def _validate_range(file_path, start, end):
+    """
+    Validate the lines in one byte range of a GFF3 file in a worker process.
+    
+    Args:
+        file_path (str): The path to the GFF3 file.
+        start (int): The byte offset of the first line in the range.
+        end (int): The byte offset just past the last line in the range.
+    
+    Returns:
+        tuple: The line count, whether ##FASTA was reached, the per-line errors
+        (numbered from 1 within the range), and the IDs (with the line in the
+        range that defined each), Parent edges, feature types and ID references
+        collected.
+    """
+    validator = _worker_validator
+    validator._reset()
+    with open(file_path, 'rb', buffering=READ_BUFFER_SIZE) as f:
+        f.seek(start)
+        errors, line_count, reached_fasta = validator._validate_lines(validator._iter_lines(f, end - start))
+    int_to_id = validator._int_to_id
+    parent_edges = [(int_to_id[parent], int_to_id[child]) for parent, child in validator._parent_edges]
+    return (line_count, reached_fasta, errors, validator.seen_ids, parent_edges,
+            validator.feature_types, validator._ref_lines, validator._ref_ids)
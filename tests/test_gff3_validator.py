@@ -0,0 +1,103 @@
+import importlib.util
+import os
+import random
+import sys
+
+import pytest
+
+pytest.importorskip('linkml_runtime')
+
+VALIDATOR_PATH = os.path.join(os.path.dirname(__file__), os.pardir, 'python', 'gff3-validator.py')
+
+
+class _Definition:
+    """A schema element whose typeof() rejects a single sentinel value."""
+    
+    def __init__(self, permissible_values=None):
+        self.permissible_values = permissible_values
+    
+    def typeof(self, value):
+        return value != 'BAD'
+
+
+class _SchemaView:
+    """Just enough of SchemaView to build a GFF3Validator without a schema file."""
+    
+    classes = {'Seqid': _Definition(), 'Source': _Definition(),
+               'Type': _Definition({'gene': None, 'mRNA': None, 'exon': None})}
+    slots = {name: _Definition() for name in ('score', 'phase', 'ID', 'Name', 'Parent', 'Alias', 'Note',
+                                              'Target', 'Derives_from', 'Gap', 'Sequence', 'Codon')}
+    
+    def __init__(self, schema_path):
+        pass
+    
+    def all_class_names(self):
+        return list(self.classes)
+    
+    def all_slot_names(self):
+        return list(self.slots)
+    
+    def get_class(self, name):
+        return self.classes[name]
+    
+    def get_slot(self, name):
+        return self.slots[name]
+    
+    def has_class(self, name):
+        return name in self.classes
+
+
+@pytest.fixture
+def module(monkeypatch):
+    # Registered under an importable name so pool workers can unpickle _validate_range
+    spec = importlib.util.spec_from_file_location('gff3_validator', VALIDATOR_PATH)
+    module = importlib.util.module_from_spec(spec)
+    monkeypatch.setitem(sys.modules, 'gff3_validator', module)
+    spec.loader.exec_module(module)
+    monkeypatch.setattr(module, 'SchemaView', _SchemaView)
+    return module
+
+
+def _random_gff(rng, n_lines):
+    ids = [f'f{i}' for i in range(n_lines // 2 + 1)]
+    lines = ['##gff-version 3']
+    for _ in range(n_lines):
+        roll = rng.random()
+        if roll < 0.05:
+            lines.append('# comment')
+            continue
+        if roll < 0.08:
+            lines.append('')
+            continue
+        if roll < 0.1:
+            lines.append('not a feature line')
+            continue
+        attributes = [f'ID={rng.choice(ids)}']
+        if rng.random() < 0.7:
+            attributes.append('Parent=' + ','.join(rng.sample(ids, rng.randint(1, 2))))
+        if rng.random() < 0.1:
+            attributes.append(f'Derives_from={rng.choice(ids)}')
+        if rng.random() < 0.1:
+            attributes.append(f'Target={rng.choice(ids)} 1 10')
+        if rng.random() < 0.1:
+            attributes.append('Alias=bad alias')
+        start = rng.randint(0, 50)
+        lines.append('\t'.join(['chr1', 'src', rng.choice(['gene', 'mRNA', 'exon']), str(start),
+                                str(start + rng.randint(-5, 50)), '.', rng.choice('+-.?'), '.',
+                                ';'.join(attributes)]))
+    if rng.random() < 0.3:
+        lines += ['##FASTA', '>chr1', 'ACGT']
+    return '\n'.join(lines) + '\n'
+
+
+@pytest.mark.parametrize('seed', range(5))
+def test_validate_file_parallel_matches_validate_file(module, monkeypatch, tmp_path, seed):
+    monkeypatch.setattr(module, 'READ_CHUNK_SIZE', 7)
+    rng = random.Random(seed)
+    path = tmp_path / 'random.gff'
+    path.write_text(_random_gff(rng, rng.randint(20, 200)))
+    
+    validator = module.GFF3Validator()
+    expected = validator.validate_file(str(path))
+    for workers in range(1, 17):
+        assert validator.validate_file_parallel(str(path), workers) == expected